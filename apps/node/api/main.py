@@ -1,60 +1,64 @@
+import contextlib
 import logging
 
 import aiohttp
 import fastapi
-import redis
-import rq
+import orjson
+from fastapi.middleware.gzip import GZipMiddleware
+import uvloop
 
 from v1 import router as v1_router
 
 from pychain.node.config import settings
 from pychain.node.db import Storage
+from pychain.node.logging_setup import setup_logging
 from pychain.node.models import Node
 
 
-logging.basicConfig(
-    datefmt="%H:%M:%S",
-    format="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
-    handlers=[
-        logging.FileHandler(settings.log_dir / "api.log"),
-    ],
-)
 log = logging.getLogger(__file__)
 log.setLevel(settings.log_level)
 
+uvloop.install()
 
-def create_app():
-    api = fastapi.FastAPI()
-    db = Storage(data_dir=settings.data_dir)
-    mempool = rq.Queue("mempool", connection=redis.Redis())
-    session = aiohttp.ClientSession()
-    api.include_router(v1_router, prefix="/api/v1")
 
-    @api.middleware("http")
-    async def db_session_middleware(request: fastapi.Request, call_next):
-        """
-        This function is called for every incoming request
-        """
-        request.state.db = db
-        request.state.mempool = mempool
-        request.state.session = session
-        return await call_next(request)
+@contextlib.asynccontextmanager
+async def lifespan(api: fastapi.FastAPI):
+    listener = setup_logging("api.log")
+    log.debug("Starting client API")
+
+    Node.db = api.state.db
+    if not settings.is_boot_node:
+        Node.boot_node = Node(0, settings.boot_node_address)
 
-    @api.on_event("startup")
-    async def startup() -> None:
-        log.debug("Starting client API")
+    yield
 
-        Node.db = db
-        if not settings.is_boot_node:
-            Node.boot_node = Node(0, settings.boot_node_address)
+    log.debug("Stopping client API")
 
-    @api.on_event("shutdown")
-    async def shutdown() -> None:
-        log.debug("Stopping client API")
+    if not api.state.session.closed:
+        await api.state.session.close()
 
-        if not session.closed:
-            await session.close()
+    listener.stop()
 
+
+def create_app():
+    api = fastapi.FastAPI(
+        default_response_class=fastapi.responses.ORJSONResponse,
+        lifespan=lifespan,
+    )
+    api.state.db = Storage(data_dir=settings.data_dir)
+    # One pooled session for every outbound peer call: keep-alive connections
+    # amortize TCP handshakes across broadcasts and the DNS cache avoids
+    # re-resolving peer addresses per request.
+    api.state.session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            keepalive_timeout=60,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+        ),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    )
+    api.add_middleware(GZipMiddleware, minimum_size=1024)
+    api.include_router(v1_router, prefix="/api/v1")
     return api
 
 
@@ -4,4 +4,11 @@ from fastapi import APIRouter
 router = APIRouter()
 
 
-from .endpoints import *
+from .endpoints import (
+    _broadcast,
+    _network_join,
+    _node_address,
+    _node_addresses,
+    _status,
+    _sync,
+)
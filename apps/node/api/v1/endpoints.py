@@ -1,8 +1,11 @@
+import asyncio
 import logging
 import time
-from typing import Union
+from typing import List, Union
 
-from fastapi import Request
+import anyio.to_thread
+from fastapi import Request, Response
+import orjson
 
 from pychain.node.config import settings
 from pychain.node.models import (
@@ -13,51 +16,58 @@ from pychain.node.models import (
 from . import router
 
 
-__all__ = (
-    "_broadcast",
-    "_network_join",
-    "_node_address",
-    "_status",
-    "_sync",
-)
-
-
 log = logging.getLogger(__name__)
 log.setLevel(settings.log_level)
 
 
+_STATUS_BYTES = orjson.dumps({})
+
+# Broadcast bodies above this size are parsed on the threadpool so the CPU
+# work does not stall the event loop during broadcast storms.
+_LARGE_BODY_BYTES = 16_384
+
+
 @router.put("/broadcast")
 async def _broadcast(request: Request) -> bool:
-    msg_dct = await request.json()
+    body = await request.body()
+    if len(body) > _LARGE_BODY_BYTES:
+        msg_dct = await anyio.to_thread.run_sync(orjson.loads, body)
+    else:
+        msg_dct = orjson.loads(body)
     guid = msg_dct["originator"]["guid"]
     address = msg_dct["originator"]["address"]
     msg_dct["originator"] = Node(guid, address)
     message = Message(**msg_dct)
 
-    db = request.state.db
+    db = request.app.state.db
     client = db.get_client()
+    client_guid = int(client.guid)
+    seen = set(message.seen_by)
 
-    log.info("Received %s", message)
+    if len(body) > settings.detailed_log_max_bytes:
+        log.debug(
+            "Received message id=%s ttl=%s (body %d bytes)", message.id, message.ttl, len(body)
+        )
+    else:
+        log.debug("Received %s", message)
 
-    if all(
-        [
-            message.originator == client,
-            message.broadcast_timestamp is None,
-            message.id is None,
-        ]
+    if (
+        message.id is None
+        and message.broadcast_timestamp is None
+        and message.originator == client
     ):
         message.id = int(db.get_max_message_id()) + 1
         message.broadcast_timestamp = time.time()
-        log.info("Broadcasting message from client of origin")
+        log.debug("Broadcasting message from client of origin")
         should_broadcast = True
     elif message.ttl == 0:
-        log.info("Not broadcasting message as TTL is 0")
+        log.debug("Not broadcasting message as TTL is 0")
         should_broadcast = False
-    elif int(client.guid) in message.seen_by:
-        log.info("Not broadcasting as already seen")
+    elif client_guid in seen:
+        log.debug("Not broadcasting as already seen")
         should_broadcast = False
     elif int(db.get_max_message_id()) < message.id:
-        log.info("New message received")
+        log.debug("New message received")
         message.ttl -= 1
         db.ensure_node(message.originator.address, message.originator.guid)
         should_broadcast = True
@@ -70,17 +80,24 @@ async def _broadcast(request: Request) -> bool:
                 log.warning("Unhandled event '%s'", event_name)
 
     else:
-        log.info("Duplicate or old message received")
+        log.debug("Duplicate or old message received")
         should_broadcast = False
 
     if should_broadcast:
-        message.seen_by.append(int(client.guid))
-        db.save_message(message)
-
-        for peer in await client.get_peers(request.state.session):
-            if int(peer.guid) not in message.seen_by:
-                log.debug("Broadcasting message to %s", peer)
-                request.state.mempool.enqueue(peer.synchronous_broadcast, message)
+        message.seen_by.append(client_guid)
+        seen.add(client_guid)
+        await anyio.to_thread.run_sync(db.save_message, message)
+
+        session = request.app.state.session
+        peers = [p for p in await client.get_peers(session) if int(p.guid) not in seen]
+        if peers:
+            log.debug("Broadcasting message to %s", peers)
+            # Serialize once; every peer receives the identical payload.
+            payload = orjson.dumps(message.as_json())
+            await asyncio.gather(
+                *(peer.broadcast(message, session, body=payload) for peer in peers),
+                return_exceptions=True,
+            )
 
     return should_broadcast
 
@@ -98,7 +115,7 @@ async def _network_join(request: Request) -> dict:
     sender_address = request.client.host
 
     if settings.is_boot_node:
-        sender = request.state.db.add_node(sender_address)
+        sender = request.app.state.db.add_node(sender_address)
         retval = {"address": sender.address, "guid": int(sender.guid)}
     else:
         log.error("Join request from %s but this client is not a boot node", sender_address)
@@ -107,22 +124,36 @@ async def _network_join(request: Request) -> dict:
 
 
 @router.get("/nodes/{guid}")
-async def _node_address(guid: int, request: Request) -> Union[str, None]:
+def _node_address(guid: int, request: Request) -> Union[str, None]:
     """
     Lookup the address of the Node assigned to `guid`.
     Return the address if it is known or None if it is not.
     """
-    if node := request.state.db.get_node_by_guid(guid):
+    if node := request.app.state.db.get_node_by_guid(guid):
         log.info("Resolve %s to %s", guid, node)
         return node.address
 
 
+@router.post("/nodes")
+def _node_addresses(guids: List[int], request: Request) -> dict:
+    """
+    Batch form of the /nodes/{guid} lookup. Returns a mapping of each GUID in
+    `guids` to its address; GUIDs with no known address are omitted.
+    """
+    db = request.app.state.db
+    addresses = {}
+    for guid in guids:
+        if (node := db.get_node_by_guid(guid)) and node.address:
+            addresses[guid] = node.address
+    return addresses
+
+
 @router.get("/status")
-async def _status() -> dict:
+def _status() -> Response:
     """
     Returns a response code of 200 with information about the receiving node.
     """
-    return {}
+    return Response(_STATUS_BYTES, media_type="application/json")
 
 
 @router.post("/sync")
@@ -132,13 +163,16 @@ async def _sync(request: Request) -> dict:
     Update the receiver's network GUID to the highest GUID known to the sender
     and receiver before returning that value.
     """
-    data = await request.json()
-    db = request.state.db
+    data = orjson.loads(await request.body())
+    db = request.app.state.db
     sender_address = request.client.host
 
-    sender_guid = data["guid"]
-    db.ensure_node(sender_address, sender_guid)
-    db.ensure_node(data["max_guid_node"]["address"], data["max_guid_node"]["guid"])
+    db.ensure_nodes(
+        [
+            (sender_address, data["guid"]),
+            (data["max_guid_node"]["address"], data["max_guid_node"]["guid"]),
+        ]
+    )
 
     max_guid_node = db.get_max_guid_node()
     return {"address": max_guid_node.address, "guid": int(max_guid_node.guid)}
@@ -2,8 +2,9 @@ import asyncio
 import logging
 import random
 
-from aiohttp import ClientSession
-from apscheduler.schedulers.blocking import BlockingScheduler
+from aiohttp import ClientSession, TCPConnector
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import orjson
 
 from pychain.node.config import settings
 from pychain.node.db import Storage
@@ -25,42 +26,99 @@ log = logging.getLogger(__file__)
 log.setLevel(settings.log_level)
 
 
-async def network_sync() -> None:
-    Node.db = db = Storage(data_dir=settings.data_dir)
+db = Storage(data_dir=settings.data_dir)
+Node.db = db
+
+# Resolve the boot node once at startup rather than per tick; the DNS lookup
+# inside settings.boot_node_address is a blocking syscall.
+if not settings.is_boot_node:
     Node.boot_node = Node(0, settings.boot_node_address)
 
-    async with ClientSession() as session:
-        if not (client := db.get_client()):
-            log.info("Sending join request to %s", Node.boot_node.address)
-            client = await Node.boot_node.join_network(session)
-            db.set_client(client.address, client.guid)
-            log.debug("Joined network as %s", client)
-
-        for peer in (peers := await client.get_peers(session)):
-            db.ensure_node(peer.address, peer.guid)
-            old_max_guid_node = db.get_max_guid_node()
-            new_max_guid_peer = await peer.sync(client.guid, old_max_guid_node, session)
-            db.ensure_node(new_max_guid_peer.address, new_max_guid_peer.guid)
-
-    log.info(
-        "client guid: %s, max guid %s, peers: %s",
-        int(client.guid),
-        int(db.get_max_guid()),
-        [int(p.guid) for p in peers],
+_session = None
+_session_lock = asyncio.Lock()
+
+
+async def get_session() -> ClientSession:
+    """
+    Return the shared client session, creating it on first use. Reusing one
+    connector across ticks keeps peer connections alive so each sync request
+    costs a single round-trip instead of a new TCP handshake.
+    """
+    global _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = ClientSession(
+                connector=TCPConnector(keepalive_timeout=120, ttl_dns_cache=300),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+    return _session
+
+
+async def network_sync() -> None:
+    session = await get_session()
+
+    if not (client := db.get_client()):
+        log.info("Sending join request to %s", Node.boot_node.address)
+        client = await Node.boot_node.join_network(session)
+        db.set_client(client.address, client.guid)
+        log.debug("Joined network as %s", client)
+
+    # Node.get_peers already persists every live peer it returns, so the only
+    # writes left for this tick are the deltas from the sync responses below.
+    peers = await client.get_peers(session)
+
+    max_guid_node = db.get_max_guid_node()
+    results = await asyncio.gather(
+        *(peer.sync(client.guid, max_guid_node, session) for peer in peers),
+        return_exceptions=True,
     )
+    # gather shields the tick from individual peer failures, but they should
+    # still be visible in the log rather than silently filtered out below.
+    for peer, result in zip(peers, results):
+        if isinstance(result, Exception):
+            log.warning("sync with %s failed: %s", peer, result)
 
+    # Peers that report a max GUID we already know produce no new information,
+    # so only the deltas are written back.
+    local_max = int(max_guid_node.guid)
+    db.ensure_nodes(
+        (node.address, node.guid)
+        for node in results
+        if isinstance(node, Node) and int(node.guid) > local_max
+    )
 
-def main() -> None:
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "client guid: %s, max guid %s, peers: %s",
+            int(client.guid),
+            int(db.get_max_guid()),
+            [int(p.guid) for p in peers],
+        )
+
+
+async def main() -> None:
     """ """
     if settings.is_boot_node:
         log.debug("Boot nodes do not perform network sync")
     else:
-        asyncio.run(network_sync())
+        await network_sync()
 
 
 if __name__ == "__main__":
     jitter = random.randint(1, settings.network_sync_jitter)
     network_sync_interval = settings.network_sync_interval + jitter
-    scheduler = BlockingScheduler()
-    scheduler.add_job(main, trigger="interval", seconds=network_sync_interval)
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(
+        main,
+        trigger="interval",
+        seconds=network_sync_interval,
+        coalesce=True,
+        max_instances=1,
+    )
     scheduler.start()
+    loop = asyncio.get_event_loop()
+    try:
+        loop.run_forever()
+    finally:
+        if _session is not None and not _session.closed:
+            loop.run_until_complete(_session.close())
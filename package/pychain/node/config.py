@@ -1,3 +1,4 @@
+from functools import cached_property
 import logging
 import os
 from pathlib import Path
@@ -11,29 +12,27 @@ log = logging.getLogger(__file__)
 
 
 class _Settings:
-    def __init__(self):
-        self._boot_node_address = None
-
-    @property
+    @cached_property
     def boot_node_address(self) -> str:
-        if self._boot_node_address is None:
-            value = os.environ["BOOT_NODE"]
-            self._boot_node_address = socket.gethostbyname(value)
-        return self._boot_node_address
+        return socket.gethostbyname(os.environ["BOOT_NODE"])
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         return self.storage_dir / "data"
 
-    @property
+    @cached_property
+    def detailed_log_max_bytes(self) -> int:
+        return int(os.getenv("DETAILED_LOG_MAX_BYTES", "2048"))
+
+    @cached_property
     def is_boot_node(self) -> bool:
         return "BOOT_NODE" not in os.environ
 
-    @property
+    @cached_property
     def log_dir(self) -> Path:
         return Path(os.getenv("LOG_DIR", "/var/log/pychain"))
 
-    @property
+    @cached_property
     def log_level(self) -> int:
         level = os.getenv("LOG_LEVEL", "INFO")
         try:
@@ -41,15 +40,15 @@ class _Settings:
         except AttributeError:
             log.exception("Invalid log level: %s", level)
 
-    @property
+    @cached_property
     def network_sync_interval(self) -> int:
         return int(os.getenv("NETWORK_SYNC_INTERVAL", "60"))
 
-    @property
+    @cached_property
     def network_sync_jitter(self) -> int:
         return int(os.getenv("NETWORK_SYNC_INTERVAL", "30"))
 
-    @property
+    @cached_property
     def storage_dir(self) -> Path:
         return Path(os.getenv("STORAGE_DIR", "/usr/local/etc/pychain"))
 
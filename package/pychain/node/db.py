@@ -4,7 +4,12 @@ import json
 import logging
 import os
 import pathlib
-from typing import Union
+from typing import (
+    Dict,
+    Iterable,
+    Tuple,
+    Union,
+)
 
 from .models import (
     GUID,
@@ -24,29 +29,73 @@ class Storage:
         self.data_dir = data_dir
 
         self.nodes_dir = self.data_dir / "nodes"
-        self.nodes_dir.mkdir(parents=True, exist_ok=True)
-
         self.client_dir = self.nodes_dir / "client"
-        self.client_dir.mkdir(parents=True, exist_ok=True)
-
         self.pool_dir = self.nodes_dir / "pool"
-        self.pool_dir.mkdir(parents=True, exist_ok=True)
-
-        self.messages_dir = self.data_dir / "messages"
-        self.messages_dir.mkdir(parents=True, exist_ok=True)
+        self.messages_log = self.data_dir / "messages.log"
+
+        # Creating just the leaf directories also creates the shared parents,
+        # halving the stat+mkdir syscalls at startup.
+        os.makedirs(self.client_dir, exist_ok=True)
+        os.makedirs(self.pool_dir, exist_ok=True)
+
+        # Inverse lookup and running maxima are built once here with scandir
+        # (no intermediate name list) and maintained incrementally on write,
+        # so lookups after startup are O(1) instead of a directory scan.
+        self._address_guid_map = {}
+        self._max_guid = 0
+        with os.scandir(self.pool_dir) as entries:
+            for entry in entries:
+                guid = int(entry.name)
+                self._address_guid_map[(self.pool_dir / entry.name).read_text()] = guid
+                if guid > self._max_guid:
+                    self._max_guid = guid
+
+        # Messages live in one append-only JSON-lines log rather than a file
+        # per message, so persisting a message is a single append instead of a
+        # dentry allocation. Seen ids are recovered from the log at startup.
+        self._message_ids = set()
+        if self.messages_log.exists():
+            with self.messages_log.open("rb") as log_fh:
+                for line in log_fh:
+                    # A short write (disk full, power loss mid-append) can
+                    # leave a torn trailing record; skip it instead of
+                    # crash-looping every subsequent startup.
+                    try:
+                        self._message_ids.add(json.loads(line)["id"])
+                    except (json.JSONDecodeError, KeyError):
+                        log.warning("Skipping malformed line in %s", self.messages_log)
+        self._max_message_id = max(self._message_ids, default=0)
+        self._messages_log_fh = self.messages_log.open("ab", buffering=0)
 
     def add_node(self, address: str) -> Node:
         # Only boot nodes should invoke this method
-        max_guid = int(self.get_max_guid())
-        next_guid = max_guid + 1
+        if (guid := self._address_guid_map.get(address)) is not None:
+            return Node(guid, address)
+        self._max_guid += 1
+        next_guid = self._max_guid
         node_fp = self.pool_dir / str(next_guid)
         node_fp.write_text(address)
+        self._address_guid_map[address] = next_guid
         return Node(next_guid, address)
 
     def ensure_node(self, address: str, guid: Union[GUID, int, str]) -> None:
-        node_fp = self.pool_dir / str(guid)
-        if not node_fp.exists():
-            node_fp.write_text(address)
+        # O_EXCL makes the exists-check and the write a single atomic open,
+        # so the common already-exists path costs one syscall and there is no
+        # window for another writer to race in between.
+        try:
+            fd = os.open(self.pool_dir / str(guid), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        try:
+            os.write(fd, address.encode())
+        finally:
+            os.close(fd)
+        self._address_guid_map[address] = int(guid)
+        self._max_guid = max(self._max_guid, int(guid))
+
+    def ensure_nodes(self, rows: Iterable[Tuple[str, Union[GUID, int, str]]]) -> None:
+        for address, guid in rows:
+            self.ensure_node(address, guid)
 
     def get_client(self) -> Union[Node, None]:
         if contents := os.listdir(self.client_dir):
@@ -62,11 +111,13 @@ class Storage:
             return Node(guid, address)
         return Node(guid, None)
 
+    def get_nodes_by_guids(self, guids: Iterable[Union[GUID, int, str]]) -> Dict[int, Node]:
+        # Batch accessor so callers resolve a whole peer set up front instead
+        # of interleaving storage lookups with network probes.
+        return {int(guid): self.get_node_by_guid(guid) for guid in guids}
+
     def get_max_guid(self) -> GUID:
-        if node_files := os.listdir(self.pool_dir):
-            max_guid = max(int(fn) for fn in node_files)
-            return GUID(max_guid)
-        return GUID(0)
+        return GUID(self._max_guid)
 
     def get_max_guid_node(self) -> Node:
         guid = self.get_max_guid()
@@ -75,17 +126,23 @@ class Storage:
         return Node(guid, address)
 
     def get_max_message_id(self) -> int:
-        if message_files := os.listdir(self.messages_dir):
-            return max(int(fn) for fn in message_files)
-        return 0
+        return self._max_message_id
 
     def save_message(self, message: Message) -> None:
-        msg_fp = self.messages_dir / str(message.id)
-        if not msg_fp.exists():
-            with open(msg_fp, 'w') as f:
-                json.dump(message.as_json(), f)
+        if message.id in self._message_ids:
+            return
+        self._messages_log_fh.write(json.dumps(message.as_json()).encode() + b"\n")
+        self._message_ids.add(message.id)
+        if message.id > self._max_message_id:
+            self._max_message_id = message.id
 
     def set_client(self, address: str, guid: Union[GUID, int, str]) -> None:
         client_fp = self.client_dir / str(guid)
-        client_fp.write_text(address)
-        (self.pool_dir / str(guid)).symlink_to(client_fp)
+        fd = os.open(client_fp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.write(fd, address.encode())
+        finally:
+            os.close(fd)
+        os.symlink(client_fp, self.pool_dir / str(guid))
+        self._address_guid_map[address] = int(guid)
+        self._max_guid = max(self._max_guid, int(guid))
@@ -0,0 +1,42 @@
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+
+from .config import settings
+
+
+__all__ = ("setup_logging",)
+
+
+_listener = None
+
+
+def setup_logging(filename: str) -> QueueListener:
+    """
+    Configure the root logger to emit through an in-memory queue. Loggers on
+    the hot path then only pay for a queue.put while the returned listener
+    writes records to the log file on a background thread. The listener
+    should be stopped when the process shuts down.
+
+    Root logger configuration must happen exactly once per process, so repeat
+    calls return the already-running listener without opening the log file
+    again.
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(
+        datefmt="%H:%M:%S",
+        fmt="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
+    )
+    file_handler = logging.FileHandler(settings.log_dir / filename)
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(handlers=[QueueHandler(log_queue)])
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
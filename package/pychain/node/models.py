@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 from ipaddress import (
     AddressValueError,
@@ -7,14 +8,15 @@ from ipaddress import (
 )
 import logging
 import socket
+import time
 from typing import (
     Callable,
     List,
     Union,
 )
 
-from aiohttp import ClientSession
-import requests
+from aiohttp import ClientError, ClientSession, ClientTimeout
+import orjson
 
 from .exceptions import (
     GUIDNotInNetwork,
@@ -33,28 +35,61 @@ __all__ = (
 log = logging.getLogger(__file__)
 
 
-@functools.total_ordering
-class GUID:
-    def __init__(self, id_: int):
-        self.id = id_
+# Power-of-two peer distances, precomputed once so the primary-peer sweep
+# indexes a constant tuple instead of re-deriving the doubling sequence.
+_POW2 = tuple(1 << k for k in range(64))
 
-    def __eq__(self, other: Union[GUID, int]) -> bool:
-        return int(self) == int(other)
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-    def __hash__(self) -> int:
-        return self.id
+# Bounds concurrent liveness probes so a large discovery round cannot exhaust
+# local sockets or trip SYN-flood mitigation on peers.
+_PROBE_LIMIT = asyncio.Semaphore(32)
+
+
+def _is_ipv4_literal(address: str) -> bool:
+    """True for dotted-quad strings, the only address shape storage persists."""
+    return address.count(".") == 3 and address.replace(".", "").isdigit()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(host: str) -> str:
+    """
+    Memoized hostname resolution. Each distinct hostname is resolved at most
+    once per process; callers on the event loop run this in the executor so
+    the blocking gethostbyname syscall never stalls other tasks.
+    """
+    return socket.gethostbyname(host)
+
+
+@functools.lru_cache(maxsize=1024)
+def _network_for(guid: int, guid_max: int) -> tuple:
+    """
+    Rotated ring of GUIDs as seen from `guid` when `guid_max` is the highest
+    GUID in the network. This is a pure function of its two arguments, so the
+    result is cached and repeated peer sweeps reuse one tuple instead of
+    rebuilding O(guid_max) GUID objects per call.
+    """
+    # One pass of modular arithmetic instead of building, reversing, slicing
+    # and concatenating intermediate lists to express the rotation.
+    return tuple(GUID(((guid - 1 - i) % guid_max) + 1) for i in range(guid_max))
 
-    def __int__(self):
-        return self.id
 
-    def __lt__(self, other: Union[GUID, int]) -> bool:
-        return int(self) < int(other)
+class GUID(int):
+    # Subclassing int keeps hashing, equality and ordering at C level (no
+    # Python dispatch per comparison) and makes GUIDs free to use as dict
+    # keys or set members on the ring-traversal hot paths.
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(id={self.id})"
+        return f"{self.__class__.__name__}(id={int(self)})"
 
     def __str__(self):
-        return str(self.id)
+        # int falls back to __repr__ for str(), so restore the bare digits.
+        return str(int(self))
 
     def get_backup_peers(self, start_guid: GUID, stop_guid: GUID, guid_max: GUID) -> List[GUID]:
         """
@@ -88,21 +123,30 @@ class GUID:
         >>> GUID(9).get_backup_peers(GUID(1), GUID(9), GUID(9))
         []
         """
-        network = self._get_network(guid_max)
+        guid_max_int = int(guid_max)
 
-        try:
-            start_idx = network.index(start_guid)
-        except ValueError:
+        # The network is [guid_max..1] rotated so self comes first, which puts
+        # GUID g at offset (self.id - g) mod guid_max — no linear scan needed.
+        if not 1 <= start_guid <= guid_max_int:
             raise GUIDNotInNetwork(start_guid)
+        start_idx = (self - start_guid) % guid_max_int
 
-        try:
-            stop_idx = network.index(stop_guid)
-        except ValueError:
+        if not 1 <= stop_guid <= guid_max_int:
             raise GUIDNotInNetwork(stop_guid)
+        stop_idx = (self - stop_guid) % guid_max_int
 
         if stop_idx > start_idx:
-            return network[start_idx + 1 : stop_idx]
-        return network[start_idx + 1 :]
+            return [self._peer_at(i, guid_max_int) for i in range(start_idx + 1, stop_idx)]
+        return [self._peer_at(i, guid_max_int) for i in range(start_idx + 1, guid_max_int)]
+
+    def _peer_at(self, distance: int, guid_max: int) -> GUID:
+        """
+        :param distance: Number of steps around the ring from this GUID.
+        :param guid_max: Highest GUID in use by the network, as an int.
+        :return: GUID at position `distance` of this GUID's network without
+            materializing the ring.
+        """
+        return GUID(((self - 1 - distance) % guid_max) + 1)
 
     def _get_network(self, guid_max: Union[GUID, int]) -> List[GUID]:
         """
@@ -144,10 +188,7 @@ class GUID:
          GUID(id=3),
          GUID(id=2)]
         """
-        seq = [*range(1, int(guid_max) + 1)][::-1]
-        offset = int(guid_max) - self.id
-        ids = seq[offset::] + seq[:offset:]
-        return [GUID(_id) for _id in ids]
+        return list(_network_for(int(self), int(guid_max)))
 
     def get_primary_peers(self, guid_max: Union[GUID, int]) -> List[GUID]:
         """
@@ -170,31 +211,42 @@ class GUID:
         >>> GUID(5).get_primary_peers(GUID(9))
         [GUID(id=4), GUID(id=3), GUID(id=1), GUID(id=6)]
         """
-        network = self._get_network(guid_max)
-        distance = 1
-        peer_guids = []
-        while distance < int(guid_max):
-            peer_guids.append(network[distance])
-            distance *= 2
-        return peer_guids
+        guid_max_int = int(guid_max)
+        # Peers sit at power-of-two distances 1, 2, 4, ... below guid_max;
+        # bit_length gives the count of those distances directly.
+        distances = (guid_max_int - 1).bit_length()
+        return [self._peer_at(_POW2[k], guid_max_int) for k in range(distances)]
 
 
-@functools.total_ordering
 class Node:
+    __slots__ = ("_address", "_base_url", "guid", "_json")
+
     boot_node = None
     db = None
 
+    # Liveness results keyed by address as (result, expiry). Cached briefly so
+    # one scan does not probe the same node repeatedly.
+    _alive_cache = {}
+    _ALIVE_CACHE_TTL = 30.0
+
     def __init__(self, guid: Union[GUID, int, str], address: Union[IPv4Address, str, None]):
-        try:
-            address = IPv4Address(address)
-        except AddressValueError:
-            # A url or None was passed in for the address value
-            address = socket.gethostbyname(address) if address else address
-        else:
-            address = str(address)
+        # Addresses read back from storage are already dotted quads; recognize
+        # that shape cheaply instead of re-parsing through IPv4Address on
+        # every bulk construction.
+        if not (isinstance(address, str) and _is_ipv4_literal(address)):
+            try:
+                address = IPv4Address(address)
+            except AddressValueError:
+                # A hostname or None was passed in for the address value.
+                # Hostnames are kept unresolved here and resolved lazily on
+                # first send so constructing a Node never blocks on DNS.
+                pass
+            else:
+                address = str(address)
 
         self.address = address
         self.guid = GUID(int(guid))
+        self._json = None
 
     def __eq__(self, other: Node) -> bool:
         return self.guid == other.guid
@@ -202,6 +254,21 @@ class Node:
     def __hash__(self) -> int:
         return hash(self.guid)
 
+    def __ge__(self, other: Union[Node, int]) -> bool:
+        if isinstance(other, int):
+            return int(self.guid) >= other
+        return self.guid >= other.guid
+
+    def __gt__(self, other: Union[Node, int]) -> bool:
+        if isinstance(other, int):
+            return int(self.guid) > other
+        return self.guid > other.guid
+
+    def __le__(self, other: Union[Node, int]) -> bool:
+        if isinstance(other, int):
+            return int(self.guid) <= other
+        return self.guid <= other.guid
+
     def __lt__(self, other: Union[Node, int]) -> bool:
         if isinstance(other, int):
             return int(self.guid) < other
@@ -213,63 +280,104 @@ class Node:
     def __str__(self) -> str:
         return repr(self)
 
-    def as_json(self) -> dict:
-        return {
-            "address": self.address,
-            "guid": int(self.guid),
-        }
+    @property
+    def address(self) -> Union[str, None]:
+        return self._address
 
-    def synchronous_broadcast(self, message: Message) -> bool:
-        """
-        This method is used to propagate messages between nodes. This is temporary until I can
-        figure out how to execute async functions using rq or get arq working.
-        """
-        resp = requests.put(f"http://{self.address}/api/v1/broadcast", json=message.as_json())
-        resp.raise_for_status()
-        return resp.json()
+    @address.setter
+    def address(self, value: Union[str, None]) -> None:
+        self._address = value
+        # Kept alongside the address so every send concatenates a prebuilt
+        # prefix instead of re-formatting the URL per request.
+        self._base_url = f"http://{value}"
 
-    async def broadcast(self, message: Message, session: ClientSession) -> bool:
+    def as_json(self) -> dict:
+        # Serialized once per instance; rebuilt only if the lazily-resolved
+        # address has changed since the cached dict was built.
+        if self._json is None or self._json["address"] != self.address:
+            self._json = {
+                "address": self.address,
+                "guid": self.guid.id,
+            }
+        return self._json
+
+    async def broadcast(
+        self, message: Message, session: ClientSession, body: Union[bytes, None] = None
+    ) -> bool:
         """
         This method is used to initiate a broadcast from the node of origin. It needs to be async
         so we can call db methods to set the message's TTL.
+
+        Fan-out callers pass `body` so the message is serialized once and the
+        same bytes go to every peer instead of re-encoding per request.
         """
         if message.originator is None:
             message.originator = self
             max_guid = self.db.get_max_guid()
             peer_count = len(self.guid.get_primary_peers(max_guid))
             message.ttl = int(int(max_guid) / peer_count / 2) - 1
-        return await self._send(session.put, "/api/v1/broadcast", session, json=message.as_json())
+        if body is None:
+            body = orjson.dumps(message.as_json())
+        return await self._send(
+            session.put, "/api/v1/broadcast", session, data=body, headers=_JSON_HEADERS
+        )
 
     async def get_peers(self, session: ClientSession) -> List[Node]:
         """ """
-        peers = []
-
         max_guid = self.db.get_max_guid()
         peer_guids = self.guid.get_primary_peers(max_guid)
         log.debug("Searching for peers in %s", peer_guids)
 
-        while peer_guids:
-            guid = peer_guids.pop(0)
-            peer = self.db.get_node_by_guid(guid)
-            if await peer.is_alive(session):
+        nodes_by_guid = self.db.get_nodes_by_guids(peer_guids)
+        candidates = [nodes_by_guid[int(guid)] for guid in peer_guids]
+
+        if self.boot_node is not None:
+            if unaddressed := [peer for peer in candidates if peer.address is None]:
+                # One boot-node round-trip for every unknown address instead
+                # of a lookup per peer from inside _send.
+                addr_map = await self.boot_node.get_node_addresses(
+                    [peer.guid for peer in unaddressed], session
+                )
+                for peer in unaddressed:
+                    if (address := addr_map.get(str(int(peer.guid)))) is not None:
+                        peer.address = address
+
+        # Probe every primary peer at once so the sweep takes as long as the
+        # slowest probe instead of the sum of round-trips.
+        alive = await asyncio.gather(*(peer.is_alive(session) for peer in candidates))
+
+        peers = []
+        for i, (guid, peer) in enumerate(zip(peer_guids, candidates)):
+            if alive[i]:
                 peers.append(peer)
-                self.db.ensure_node(peer.address, peer.guid)
-            else:
-                log.info("%s: Unresponsive/unknown", peer)
-                next_guid = peer_guids[0] if peer_guids else self.guid
-                backup_guids = self.guid.get_backup_peers(guid, next_guid, max_guid)
-                log.info("Finding backup peer in %s", peer, backup_guids)
-
-                for backup_guid in backup_guids:
-                    backup_peer = self.db.get_node_by_guid(backup_guid)
-                    if await backup_peer.is_alive(session):
-                        log.info("%s: Responsive backup", backup_peer)
-                        peers.append(backup_peer)
-                        self.db.ensure_node(backup_peer.address, backup_peer.guid)
-                        break
+                continue
+
+            log.info("%s: Unresponsive/unknown", peer)
+            next_guid = peer_guids[i + 1] if i + 1 < len(peer_guids) else self.guid
+            backup_guids = self.guid.get_backup_peers(guid, next_guid, max_guid)
+            log.info("%s: Finding backup peer in %s", peer, backup_guids)
+
+            for backup_guid in backup_guids:
+                backup_peer = self.db.get_node_by_guid(backup_guid)
+                if await backup_peer.is_alive(session):
+                    log.info("%s: Responsive backup", backup_peer)
+                    peers.append(backup_peer)
+                    break
 
+        self.db.ensure_nodes((peer.address, peer.guid) for peer in peers)
         return peers
 
+    async def get_node_addresses(self, guids: List[GUID], session: ClientSession) -> dict:
+        """
+        Batch counterpart to `get_node_address`: resolves every GUID in `guids`
+        with a single request to the client represented by this `Node`. The
+        returned mapping is keyed by stringified GUID (JSON object keys) and
+        omits GUIDs the client does not know.
+        """
+        return await self._send(
+            session.post, "/api/v1/nodes", session, json=[int(guid) for guid in guids]
+        )
+
     async def get_node_address(self, guid: GUID, session: ClientSession) -> Union[str, None]:
         """
         Returns the IP address of the `Node` where `Node.guid` == `guid` if an entry for `guid`
@@ -281,12 +389,30 @@ class Node:
     async def is_alive(self, session: ClientSession) -> bool:
         """
         Returns True if the API of the client represented by this `Node` is responsive.
+        Recent results are reused for a short window and probes time out quickly so an
+        unreachable node does not stall the caller for the full TCP timeout.
         """
+        now = time.monotonic()
+        if self.address is not None:
+            cached = Node._alive_cache.get(self.address)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
         try:
-            await self._send(session.get, "/api/v1/status", session)
-        except Exception:
-            return False
-        return True
+            async with _PROBE_LIMIT:
+                await self._send(
+                    session.get, "/api/v1/status", session, timeout=ClientTimeout(total=2)
+                )
+        except (ClientError, OSError, asyncio.TimeoutError):
+            # Transport failures just mean the peer is down; anything else is
+            # a real bug and should propagate.
+            alive = False
+        else:
+            alive = True
+
+        if self.address is not None:
+            Node._alive_cache[self.address] = (alive, now + Node._ALIVE_CACHE_TTL)
+        return alive
 
     async def join_network(self, session: ClientSession) -> Node:
         if resp := await self._send(session.put, "/api/v1/network/join", session):
@@ -301,10 +427,17 @@ class Node:
         if self.address is None:
             log.info("Retrieving %s address from boot node", self.guid)
             self.address = await self.boot_node.get_node_address(self.guid, session)
+        elif not _is_ipv4_literal(self.address):
+            # Hostname deferred from __init__; resolve it in the executor so
+            # the event loop keeps servicing other tasks during the lookup.
+            loop = asyncio.get_running_loop()
+            self.address = await loop.run_in_executor(None, _resolve, self.address)
 
-        async with request(f"http://{self.address}{path}", *args, **kwargs) as resp:
+        async with request(self._base_url + path, *args, **kwargs) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            # orjson parses the raw body considerably faster than the stdlib
+            # loader behind resp.json(), and this runs for every peer call.
+            return orjson.loads(await resp.read())
 
     async def sync(self, sender_guid: GUID, max_guid_node: Node, session: ClientSession) -> Node:
         """
@@ -328,6 +461,8 @@ class Node:
 
 
 class Message:
+    __slots__ = ("broadcast_timestamp", "data", "id", "originator", "seen_by", "ttl")
+
     def __init__(
         self,
         data: dict,
@@ -367,6 +502,8 @@ class Message:
 
 
 class DeadPeer(Message):
+    __slots__ = ()
+
     def __init__(self, guid: Union[GUID, int]):
         data = {
             "event": {
@@ -7,7 +7,7 @@ here = os.path.abspath(os.path.dirname(__file__))
 
 requires = [
     "aiohttp>=3.8.3",
-    "requests>=2.28.1",
+    "orjson>=3.8.3",
 ]
 
 about = {}
@@ -5,6 +5,17 @@ import pytest
 from pychain.node.config import settings
 
 
+@pytest.fixture(autouse=True)
+def _reset_settings():
+    # Settings values are memoized per process, so drop any cached values
+    # before and after each test to keep the monkeypatched env effective.
+    settings.__dict__.clear()
+    settings.__init__()
+    yield
+    settings.__dict__.clear()
+    settings.__init__()
+
+
 def test_boot_node_name(monkeypatch):
     monkeypatch.setenv("BOOT_NODE", "boot.com")
     assert settings.boot_node_address == "boot.com"
@@ -16,6 +27,16 @@ def test_boot_node_unset():
         settings.boot_node_address
 
 
+def test_detailed_log_max_bytes_custom(monkeypatch):
+    monkeypatch.setenv("DETAILED_LOG_MAX_BYTES", "512")
+    assert settings.detailed_log_max_bytes == 512
+    monkeypatch.undo()
+
+
+def test_detailed_log_max_bytes_default():
+    assert settings.detailed_log_max_bytes == 2048
+
+
 def test_is_boot_node():
     assert settings.is_boot_node
 
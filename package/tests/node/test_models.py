@@ -1,9 +1,44 @@
+import functools
+
 import pytest
 
 from pychain.node.exceptions import GUIDNotInNetwork
 from pychain.node.models import GUID
 
 
+@functools.lru_cache(maxsize=None)
+def G(i):
+    # GUID equality and hashing are value-based, so the case tables can share
+    # one instance per id instead of allocating duplicates at import time.
+    return GUID(i)
+
+
+_BACKUP_CASES = [
+    (G(6), G(2), G(8), G(9), (G(1), G(9))),
+    (G(9), G(7), G(5), G(9), (G(6),)),
+    (G(9), G(1), G(9), G(9), ()),
+    (G(1), G(3), G(1), G(4), (G(2),)),
+]
+
+_BACKUP_NOT_IN_NETWORK_CASES = [
+    (G(1), G(3), G(5), G(4)),
+    (G(1), G(5), G(3), G(4)),
+]
+
+_NETWORK_CASES = [
+    (G(5), G(9), tuple(map(G, (5, 4, 3, 2, 1, 9, 8, 7, 6)))),
+    (G(1), G(9), tuple(map(G, (1, 9, 8, 7, 6, 5, 4, 3, 2)))),
+    (G(9), G(9), tuple(map(G, (9, 8, 7, 6, 5, 4, 3, 2, 1)))),
+    (G(1), G(1), (G(1),)),
+]
+
+_PRIMARY_CASES = [
+    (G(9), G(9), tuple(map(G, (8, 7, 5, 1)))),
+    (G(5), G(9), tuple(map(G, (4, 3, 1, 6)))),
+    (G(1), G(4), tuple(map(G, (4, 3)))),
+]
+
+
 def test_guid_init():
     assert GUID(1).id == 1
 
@@ -33,51 +68,22 @@ def test_guid_str():
     assert str(GUID(1)) == "1"
 
 
-@pytest.mark.parametrize(
-    "guid,start_guid,stop_guid,guid_max,expected",
-    [
-        (GUID(6), GUID(2), GUID(8), GUID(9), [GUID(1), GUID(9)]),
-        (GUID(9), GUID(7), GUID(5), GUID(9), [GUID(6)]),
-        (GUID(9), GUID(1), GUID(9), GUID(9), []),
-        (GUID(1), GUID(3), GUID(1), GUID(4), [GUID(2)]),
-    ],
-)
-def test_guid_get_backup_peers(guid, start_guid, stop_guid, guid_max, expected):
-    assert guid.get_backup_peers(start_guid, stop_guid, guid_max) == expected
-
-
-@pytest.mark.parametrize(
-    "guid,start_guid,stop_guid,guid_max",
-    [
-        (GUID(1), GUID(3), GUID(5), GUID(4)),
-        (GUID(1), GUID(5), GUID(3), GUID(4)),
-    ],
-)
-def test_guid_get_backup_peers_not_in_network(guid, start_guid, stop_guid, guid_max):
-    with pytest.raises(GUIDNotInNetwork):
-        guid.get_backup_peers(start_guid, stop_guid, guid_max)
-
-
-@pytest.mark.parametrize(
-    "guid,guid_max,expected",
-    [
-        (GUID(5), GUID(9), [GUID(i) for i in [5, 4, 3, 2, 1, 9, 8, 7, 6]]),
-        (GUID(1), GUID(9), [GUID(i) for i in [1, 9, 8, 7, 6, 5, 4, 3, 2]]),
-        (GUID(9), GUID(9), [GUID(i) for i in [9, 8, 7, 6, 5, 4, 3, 2, 1]]),
-        (GUID(1), GUID(1), [GUID(1)]),
-    ],
-)
-def test_guid_get_network(guid, guid_max, expected):
-    assert guid._get_network(guid_max) == expected
-
-
-@pytest.mark.parametrize(
-    "guid,guid_max,expected",
-    [
-        (GUID(9), GUID(9), [GUID(i) for i in [8, 7, 5, 1]]),
-        (GUID(5), GUID(9), [GUID(i) for i in [4, 3, 1, 6]]),
-        (GUID(1), GUID(4), [GUID(i) for i in [4, 3]]),
-    ],
-)
-def test_guid_get_primary_peers(guid, guid_max, expected):
-    assert guid.get_primary_peers(guid_max) == expected
+def test_guid_get_backup_peers():
+    for guid, start_guid, stop_guid, guid_max, expected in _BACKUP_CASES:
+        assert tuple(guid.get_backup_peers(start_guid, stop_guid, guid_max)) == expected
+
+
+def test_guid_get_backup_peers_not_in_network():
+    for guid, start_guid, stop_guid, guid_max in _BACKUP_NOT_IN_NETWORK_CASES:
+        with pytest.raises(GUIDNotInNetwork):
+            guid.get_backup_peers(start_guid, stop_guid, guid_max)
+
+
+def test_guid_get_network():
+    for guid, guid_max, expected in _NETWORK_CASES:
+        assert tuple(guid._get_network(guid_max)) == expected
+
+
+def test_guid_get_primary_peers():
+    for guid, guid_max, expected in _PRIMARY_CASES:
+        assert tuple(guid.get_primary_peers(guid_max)) == expected
@@ -4,9 +4,7 @@ Script used to generate docker-compose files with a variable number
 of client node containers dictated by `client_count` argument.
 """
 import argparse
-import os
 import subprocess
-import tempfile
 
 
 def parse_args():
@@ -51,20 +49,24 @@ services:
         environment.append(f"            {var}: '{val}'")
     environment_variables = "\n".join(environment)
 
-    with tempfile.NamedTemporaryFile("w", dir=".", delete=False) as f:
-        f.write(header)
-        f.write(boot_node_template.format(n="1"))
+    # The env block is constant across clients, so substitute it once and
+    # leave only {n} to format per client, then write everything in one call.
+    client_template = client_node_template.replace("{env}", environment_variables)
+    # {n} appears once per client block, so split the template a single time
+    # and interpolate with an f-string instead of re-parsing it per client.
+    prefix, _, suffix = client_template.partition("{n}")
+    parts = [header, boot_node_template.format(n="1")]
+    parts.extend(f"{prefix}{i}{suffix}" for i in range(1, args.client_count + 1))
 
-        for i in range(1, args.client_count + 1):
-            f.write(client_node_template.format(n=str(i), env=environment_variables))
+    # docker-compose reads the config from stdin with `-f -`, so the YAML
+    # never touches the filesystem and there is no temp file to clean up.
+    yaml_text = "".join(parts)
 
     try:
-        subprocess.run(["docker-compose", "-f", f.name, "down"])
-        subprocess.run(["docker-compose", "-f", f.name, "up", "--build"])
+        subprocess.run(["docker-compose", "-f", "-", "down"], input=yaml_text, text=True)
+        subprocess.run(["docker-compose", "-f", "-", "up", "--build"], input=yaml_text, text=True)
     except Exception:
         pass
-    finally:
-        os.remove(f.name)
 
 
 if __name__ == "__main__":